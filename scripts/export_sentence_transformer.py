@@ -6,36 +6,42 @@ This script downloads pre-trained Sentence Transformers models from HuggingFace
 and exports them to ONNX format for efficient inference with ONNX Runtime.
 
 Usage:
-    python export_sentence_transformer.py all-MiniLM-L6-v2
-    python export_sentence_transformer.py --list
+    python export_sentence_transformer.py export all-MiniLM-L6-v2
+    python export_sentence_transformer.py verify all-MiniLM-L6-v2
+    python export_sentence_transformer.py list
     python export_sentence_transformer.py --help
 
+The pre-subcommand forms (`<model-key> [options]` and `--list`) still work.
+
 Requirements:
     pip install sentence-transformers optimum onnx onnxruntime transformers
 """
 
 import sys
 import os
+import platform
+import subprocess
+import tempfile
 import argparse
+import time
+import hashlib
+import importlib
+import json
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
+from types import MappingProxyType
 
-try:
-    from optimum.onnxruntime import ORTModelForFeatureExtraction
-    from transformers import AutoTokenizer
-    import onnxruntime as ort
-except ImportError as e:
-    print("Error: Required packages not installed.")
-    print("\nPlease install dependencies:")
-    print("  pip install sentence-transformers optimum onnx onnxruntime transformers")
-    sys.exit(1)
-
-# Available models with their specifications
+# Available models with their specifications. pooling and normalize mirror
+# each model's sentence-transformers Pooling and Normalize modules.
 MODELS = {
     # Small & Fast Models (Recommended)
     "all-MiniLM-L6-v2": {
         "name": "sentence-transformers/all-MiniLM-L6-v2",
         "dims": 384,
         "max_len": 128,
+        "pooling": "mean",
+        "normalize": True,
         "params": "22M",
         "description": "General purpose - RECOMMENDED",
         "category": "small"
@@ -44,6 +50,8 @@ MODELS = {
         "name": "sentence-transformers/paraphrase-MiniLM-L3-v2",
         "dims": 384,
         "max_len": 128,
+        "pooling": "mean",
+        "normalize": False,
         "params": "17M",
         "description": "Fastest, good for real-time",
         "category": "small"
@@ -52,6 +60,8 @@ MODELS = {
         "name": "sentence-transformers/all-MiniLM-L12-v2",
         "dims": 384,
         "max_len": 128,
+        "pooling": "mean",
+        "normalize": True,
         "params": "33M",
         "description": "Balanced accuracy/speed",
         "category": "small"
@@ -62,6 +72,8 @@ MODELS = {
         "name": "sentence-transformers/all-mpnet-base-v2",
         "dims": 768,
         "max_len": 384,
+        "pooling": "mean",
+        "normalize": True,
         "params": "110M",
         "description": "Highest quality",
         "category": "large"
@@ -70,6 +82,8 @@ MODELS = {
         "name": "sentence-transformers/multi-qa-mpnet-base-dot-v1",
         "dims": 768,
         "max_len": 512,
+        "pooling": "cls",
+        "normalize": False,
         "params": "110M",
         "description": "Question answering",
         "category": "large"
@@ -80,14 +94,20 @@ MODELS = {
         "name": "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2",
         "dims": 384,
         "max_len": 128,
+        "pooling": "mean",
+        "normalize": False,
         "params": "118M",
         "description": "50+ languages",
         "category": "multilingual"
     },
     "distiluse-base-multilingual-cased-v2": {
         "name": "sentence-transformers/distiluse-base-multilingual-cased-v2",
-        "dims": 512,
+        # The transformers export stops before the sentence-transformers
+        # 768->512 Dense head, so the graph emits the 768-d hidden state
+        "dims": 768,
         "max_len": 128,
+        "pooling": "mean",
+        "normalize": False,
         "params": "135M",
         "description": "15 languages, fast",
         "category": "multilingual"
@@ -98,6 +118,8 @@ MODELS = {
         "name": "sentence-transformers/all-distilroberta-v1",
         "dims": 768,
         "max_len": 512,
+        "pooling": "mean",
+        "normalize": True,
         "params": "82M",
         "description": "RoBERTa-based",
         "category": "specialized"
@@ -106,12 +128,91 @@ MODELS = {
         "name": "sentence-transformers/msmarco-MiniLM-L6-cos-v5",
         "dims": 384,
         "max_len": 512,
+        "pooling": "mean",
+        "normalize": True,
         "params": "22M",
         "description": "Information retrieval",
         "category": "specialized"
     }
 }
 
+# Freeze entries so the registry cannot be mutated by accident
+MODELS = {key: MappingProxyType(info) for key, info in MODELS.items()}
+
+
+def _index_by_category(models):
+    """Group model keys by category, preserving registry order."""
+    index = defaultdict(list)
+    for key, info in models.items():
+        index[info["category"]].append(key)
+    return dict(index)
+
+
+# Model keys per category, precomputed once for list_models
+CATEGORIES = _index_by_category(MODELS)
+
+# Operators emitted by ORT's INT8 quantizer; at least one must be present
+# in a quantized graph for the MatMuls to actually run in integer arithmetic.
+# Static QDQ graphs carry QuantizeLinear pairs that ORT fuses at load time.
+INT8_OPS = {"QLinearMatMul", "MatMulInteger", "DynamicQuantizeMatMul", "QAttention", "QuantizeLinear"}
+
+# Graph cleanups applied to the raw export before ORT's transformer fusions
+PREPASS_PASSES = [
+    "eliminate_deadend",
+    "eliminate_identity",
+    "fuse_bn_into_conv",
+    "fuse_consecutive_transposes",
+    "fuse_matmul_add_bias_into_gemm"
+]
+
+# Opset 17 adds native LayerNormalization, which ORT maps to dedicated kernels
+DEFAULT_OPSET = 17
+
+# Largest batch the prebuilt TensorRT engine is profiled for when the batch is not pinned
+TRT_MAX_BATCH = 32
+
+# Quantization targets, in order of preference when auto-detecting
+QUANT_PROFILES = ("avx512_vnni", "avx512", "avx2", "arm64")
+
+# Representative sentences used to calibrate static quantization
+DEFAULT_CALIBRATION_FILE = Path(__file__).with_name("calibration.txt")
+
+# Numerically sensitive operators kept in FP32 when converting to FP16
+FP16_OP_BLOCK_LIST = ["LayerNormalization", "SkipLayerNormalization", "Softmax", "ReduceMean"]
+
+
+def require_dependencies():
+    """Check the heavy export dependencies, which are imported lazily where used."""
+    for module in ("onnx", "onnxruntime", "optimum.onnxruntime", "transformers"):
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            print(f"Error: Required package '{module}' not installed.")
+            print("\nPlease install dependencies:")
+            print("  pip install sentence-transformers optimum onnx onnxruntime transformers")
+            return False
+    return True
+
+
+def default_intra_op_threads():
+    """Approximate the physical core count (logical cores / 2 on SMT hosts)."""
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+def sidecar_path(model_path):
+    """External-data file that holds the weights of an ONNX model."""
+    return model_path.with_name(model_path.name + "_data")
+
+
+def model_size(model_path):
+    """Size of an ONNX model in bytes, including its external-data sidecar."""
+    size = model_path.stat().st_size
+    try:
+        size += sidecar_path(model_path).stat().st_size
+    except FileNotFoundError:
+        pass
+    return size
+
 
 def list_models():
     """Display all available models grouped by category."""
@@ -127,14 +228,15 @@ def list_models():
     }
 
     for cat_key, cat_name in categories.items():
-        models_in_cat = {k: v for k, v in MODELS.items() if v["category"] == cat_key}
-        if not models_in_cat:
+        keys = CATEGORIES.get(cat_key)
+        if not keys:
             continue
 
         print(f"\n{cat_name}:")
         print("-" * 80)
 
-        for key, info in models_in_cat.items():
+        for key in keys:
+            info = MODELS[key]
             print(f"\n  {key}")
             print(f"    Description: {info['description']}")
             print(f"    Dimensions:  {info['dims']}")
@@ -147,10 +249,94 @@ def list_models():
     print("="*80 + "\n")
 
 
-def verify_onnx_model(model_path, expected_dims):
+def make_dummy_inputs(session, batch_size, sequence_length):
+    """Build all-padding inputs for every model input, honoring pinned dims."""
+    import numpy as np
+
+    feeds = {}
+    for inp in session.get_inputs():
+        shape = [d if isinstance(d, int) else default
+                 for d, default in zip(inp.shape, (batch_size, sequence_length))]
+        dtype = np.int32 if inp.type == "tensor(int32)" else np.int64
+        ids = np.zeros(shape, dtype=dtype)
+        feeds[inp.name] = np.ones_like(ids) if inp.name == "attention_mask" else ids
+    return feeds
+
+
+def probe_batching(session, expected_dims, max_len, runs=5):
+    """Run real inference at batch 1 and 8 to catch batch-broken exports.
+
+    Returns False if the output shape is wrong; warns if batching does not
+    scale sub-linearly.
+    """
+    print(f"\n  Inference Probe (sequence length {max_len}, {runs} runs):")
+    timings = {}
+    for batch_size in (1, 8):
+        feeds = make_dummy_inputs(session, batch_size, max_len)
+        batch_size, seq_len = next(iter(feeds.values())).shape
+        if batch_size in timings:
+            continue  # Batch dim is pinned, nothing new to measure
+
+        output = session.run(None, feeds)[0]  # Warmup
+        start = time.perf_counter()
+        for _ in range(runs):
+            session.run(None, feeds)
+        timings[batch_size] = (time.perf_counter() - start) / runs
+
+        tokens_per_sec = batch_size * seq_len / timings[batch_size]
+        print(f"    - batch={batch_size}: {timings[batch_size]*1000:8.2f} ms "
+              f"({tokens_per_sec:,.0f} tokens/sec), output {list(output.shape)}")
+
+        if output.shape[0] != batch_size:
+            print(f"    ✗ Output batch size {output.shape[0]} does not match input batch size {batch_size}")
+            return False
+        if output.shape[-1] != expected_dims:
+            print(f"    ✗ Output dimensions mismatch: expected {expected_dims}, got {output.shape[-1]}")
+            return False
+
+    print(f"    ✓ Output dimensions match: {expected_dims}")
+    if 1 in timings and 8 in timings:
+        ratio = timings[8] / timings[1]
+        if ratio < 6.0:
+            print(f"    ✓ Batching scales sub-linearly: t(8)/t(1) = {ratio:.2f}")
+        else:
+            print(f"    ⚠ t(8)/t(1) = {ratio:.2f}; batching gives little benefit, the export may not be batch-friendly")
+    return True
+
+
+def benchmark_tokenizer(tokenizer, calls=1000, batch_size=32):
+    """Time batched tokenization, the usual bottleneck ahead of inference."""
+    batch = ["hello world"] * batch_size
+    tokenizer(batch, padding=True, return_tensors="np")  # Warmup
+    start = time.perf_counter()
+    for _ in range(calls):
+        tokenizer(batch, padding=True, return_tensors="np")
+    elapsed = time.perf_counter() - start
+
+    kind = "fast" if tokenizer.is_fast else "slow"
+    print(f"\n  Tokenizer ({kind}): {elapsed / (calls * batch_size) * 1e6:.2f} µs/sequence "
+          f"({calls} calls x batch {batch_size})")
+
+
+def verify_onnx_model(model_path, expected_dims, max_len, quantized=False, static=False,
+                      fp16=False, baseline_path=None, tokenizer=None):
     """Verify the exported ONNX model."""
+    import onnx
+    import onnxruntime as ort
+
     try:
-        session = ort.InferenceSession(model_path, providers=['CPUExecutionProvider'])
+        # Full graph optimization (some fusions only fire at ORT_ENABLE_ALL) on a
+        # bounded thread budget so load and latency numbers are representative
+        so = ort.SessionOptions()
+        so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        so.intra_op_num_threads = default_intra_op_threads()
+        so.inter_op_num_threads = 1
+        so.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        session = ort.InferenceSession(str(model_path), sess_options=so, providers=['CPUExecutionProvider'])
+
+        session_opts = session.get_session_options()
+        print(f"\n  Session: {session_opts.graph_optimization_level}, "
+              f"intra_op_threads={session_opts.intra_op_num_threads}")
 
         # Check inputs
         inputs = session.get_inputs()
@@ -158,38 +344,665 @@ def verify_onnx_model(model_path, expected_dims):
         for inp in inputs:
             print(f"    - {inp.name}: {inp.shape} ({inp.type})")
 
+        # Check that the fixed-shape variant has no symbolic dims left
+        if static:
+            symbolic = sorted({str(d) for inp in inputs for d in inp.shape if not isinstance(d, int)})
+            if symbolic:
+                print(f"    ℹ Dynamic dims remaining: {', '.join(symbolic)}")
+            else:
+                print("    ✓ Input shapes are fully static")
+
         # Check outputs
         outputs = session.get_outputs()
         print(f"\n  Model Outputs:")
         for out in outputs:
             print(f"    - {out.name}: {out.shape} ({out.type})")
 
-            # Verify dimensions
-            if len(out.shape) >= 2:
-                output_dims = out.shape[-1]
-                if output_dims == expected_dims or output_dims == -1:  # -1 means dynamic
-                    print(f"    ✓ Output dimensions match: {expected_dims}")
-                else:
-                    print(f"    ⚠ Output dimensions mismatch: expected {expected_dims}, got {output_dims}")
+        # Verify dimensions and batching against real output tensors
+        verified = probe_batching(session, expected_dims, max_len)
 
-        return True
+        if tokenizer is not None:
+            benchmark_tokenizer(tokenizer)
+
+        # Check that quantization actually produced integer kernels
+        if quantized:
+            graph = onnx.load(model_path, load_external_data=False).graph
+            int8_ops = sorted({node.op_type for node in graph.node} & INT8_OPS)
+            if int8_ops:
+                print(f"\n  ✓ INT8 operators present: {', '.join(int8_ops)}")
+            else:
+                print(f"\n  ⚠ No INT8 operators found ({', '.join(sorted(INT8_OPS))})")
+
+        # Check that the weights were actually converted to half precision
+        if fp16:
+            graph = onnx.load(model_path, load_external_data=False).graph
+            fp16_count = sum(1 for t in graph.initializer if t.data_type == onnx.TensorProto.FLOAT16)
+            if fp16_count:
+                print(f"\n  ✓ tensor(float16) initializers: {fp16_count}/{len(graph.initializer)}")
+            else:
+                print("\n  ⚠ No tensor(float16) initializers found")
+            if baseline_path:
+                size = model_size(model_path) / (1024*1024)
+                baseline = model_size(baseline_path) / (1024*1024)
+                print(f"  Size: {size:.2f} MB vs {baseline:.2f} MB FP32 ({(size - baseline) / baseline:+.0%})")
+
+        return verified
     except Exception as e:
         print(f"\n  ✗ Model verification failed: {e}")
         return False
 
 
-def export_model(model_key, output_base_dir="./models", verify=True):
+def prepass_model(model_path):
+    """Run shape inference and onnxoptimizer cleanups on the raw export in place.
+
+    Returns False if onnxoptimizer is not installed and the pass was skipped.
+    """
+    import onnx
+
+    try:
+        import onnxoptimizer
+    except ImportError:
+        return False
+
+    model = onnx.shape_inference.infer_shapes(onnx.load(model_path))
+    model = onnxoptimizer.optimize(model, PREPASS_PASSES)
+    onnx.save(model, model_path)
+    return True
+
+
+def optimize_model(model, output_dir):
+    """Apply ORT graph fusions and save them as model_optimized.onnx.
+
+    Returns the optimized model path, or None if the architecture is not
+    supported by the ORT transformers optimizer.
+    """
+    from optimum.onnxruntime import ORTOptimizer
+    from optimum.onnxruntime.configuration import OptimizationConfig
+
+    try:
+        optimizer = ORTOptimizer.from_pretrained(model)
+        opt_cfg = OptimizationConfig(
+            optimization_level=99,
+            optimize_for_gpu=False,
+            fp16=False,
+            enable_transformers_specific_optimizations=True,
+            disable_gelu_fusion=False,
+            disable_layer_norm_fusion=False,
+            disable_attention_fusion=False
+        )
+        optimizer.optimize(save_dir=output_dir, optimization_config=opt_cfg)
+    except Exception as e:
+        print(f"      ⚠ Graph optimization skipped: {e}")
+        return None
+
+    return output_dir / "model_optimized.onnx"
+
+
+def make_static_model(source_path, output_dir, batch_size=None, sequence_length=None):
+    """Pin symbolic input dims and save the result as model_static.onnx."""
+    import onnx
+    from onnxruntime.tools.onnx_model_utils import fix_output_shapes, make_dim_param_fixed
+
+    model = onnx.load(source_path)
+    if batch_size:
+        make_dim_param_fixed(model.graph, "batch_size", batch_size)
+    if sequence_length:
+        make_dim_param_fixed(model.graph, "sequence_length", sequence_length)
+    fix_output_shapes(model)
+
+    static_path = output_dir / "model_static.onnx"
+    onnx.save(model, static_path)
+    return static_path
+
+
+def convert_to_fp16(source_path, output_dir):
+    """Convert weights to FP16 and save the result as model_fp16.onnx."""
+    import onnx
+    # ORT's copy of onnxconverter-common's converter, which also handles
+    # blocked ops that feed graph outputs (the final LayerNorm)
+    from onnxruntime.transformers import float16
+
+    model = onnx.load(source_path)
+    model_fp16 = float16.convert_float_to_float16(
+        model,
+        keep_io_types=True,
+        op_block_list=FP16_OP_BLOCK_LIST
+    )
+
+    fp16_path = output_dir / "model_fp16.onnx"
+    onnx.save(model_fp16, fp16_path)
+    return fp16_path
+
+
+def externalize_weights(model_path):
+    """Move initializers into a <file>_data sidecar so ORT can memory-map them.
+
+    Keeps the protobuf itself small, which avoids the 2GB limit and the
+    doubled memory spike of parsing inline weights at load time.
+    """
+    import onnx
+    from onnx.external_data_helper import uses_external_data
+
+    model = onnx.load(model_path, load_external_data=False)
+    if any(uses_external_data(t) for t in model.graph.initializer):
+        return  # The exporter already split the weights out
+
+    data_path = sidecar_path(model_path)
+    data_path.unlink(missing_ok=True)  # onnx appends to an existing sidecar
+
+    onnx.save_model(
+        model,
+        model_path,
+        save_as_external_data=True,
+        all_tensors_to_one_file=True,
+        location=data_path.name,
+        size_threshold=1024,
+        convert_attribute=False
+    )
+
+
+def build_trt_engine(model_path, output_dir, max_len, batch_size=None, sequence_length=None):
+    """Build and cache a TensorRT FP16 engine for model_path under output_dir/trt_cache.
+
+    Returns the cache directory, or None if the TensorRT execution provider is
+    not available or no engine was built.
+    """
+    import onnx
+    import onnxruntime as ort
+
+    if "TensorrtExecutionProvider" not in ort.get_available_providers():
+        return None
+
+    # One optimization profile covering every shape Veccy will send, so the
+    # cached engine is reused instead of rebuilt on a new sequence length;
+    # dims pinned at export time must stay at their traced value
+    max_batch = batch_size or TRT_MAX_BATCH
+    max_seq = sequence_length or max_len
+    graph_inputs = [inp.name for inp in onnx.load(model_path, load_external_data=False).graph.input]
+
+    def profile_shapes(batch, seq):
+        return ",".join(f"{name}:{batch}x{seq}" for name in graph_inputs)
+
+    cache_dir = output_dir / "trt_cache"
+    cache_dir.mkdir(exist_ok=True)
+    providers = [
+        ("TensorrtExecutionProvider", {
+            "trt_fp16_enable": True,
+            "trt_engine_cache_enable": True,
+            "trt_engine_cache_path": str(cache_dir),
+            "trt_max_workspace_size": 2 * 1024**3,
+            "trt_profile_min_shapes": profile_shapes(batch_size or 1, sequence_length or 1),
+            "trt_profile_opt_shapes": profile_shapes(max_batch, max_seq),
+            "trt_profile_max_shapes": profile_shapes(max_batch, max_seq)
+        }),
+        "CUDAExecutionProvider",
+        "CPUExecutionProvider"
+    ]
+
+    # The engine is built on the first run and written to the cache
+    session = ort.InferenceSession(str(model_path), providers=providers)
+
+    # onnxruntime-gpu lists the provider even without the TensorRT libraries,
+    # in which case the session silently falls back to CUDA/CPU
+    if session.get_providers()[0] == "TensorrtExecutionProvider":
+        session.run(None, make_dummy_inputs(session, max_batch, max_seq))
+    if any(cache_dir.glob("*.engine")):
+        return cache_dir
+
+    if not any(cache_dir.iterdir()):
+        cache_dir.rmdir()
+    return None
+
+
+def cpu_flags():
+    """Lower-cased CPU feature flags of this host, with underscores removed."""
+    try:
+        import cpuinfo
+        flags = cpuinfo.get_cpu_info().get("flags", [])
+    except ImportError:
+        flags = []
+        try:
+            if sys.platform.startswith("linux"):
+                with open("/proc/cpuinfo") as f:
+                    for line in f:
+                        if line.startswith("flags"):
+                            flags = line.split(":", 1)[1].split()
+                            break
+            elif sys.platform == "darwin":
+                result = subprocess.run(
+                    ["sysctl", "-n", "machdep.cpu.features", "machdep.cpu.leaf7_features"],
+                    capture_output=True, text=True
+                )
+                flags = result.stdout.split()
+        except OSError:  # Masked /proc or no sysctl binary
+            return set()
+    return {flag.lower().replace("_", "") for flag in flags}
+
+
+def detect_quant_profile():
+    """Pick the best quantization profile for the host CPU.
+
+    Falls back to avx2 when the flags cannot be read, which runs on any
+    x86-64 CPU from the last decade.
+    """
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        return "arm64"
+    flags = cpu_flags()
+    if "avx512vnni" in flags:
+        return "avx512_vnni"
+    if "avx512f" in flags:
+        return "avx512"
+    return "avx2"
+
+
+def quantization_config(profile, is_static):
+    """Optimum quantization config for a CPU profile."""
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    # Static mode only needs activation ranges for the MatMul-heavy ops
+    operators = ["MatMul", "Attention"] if is_static else None
+    make_config = {
+        "avx512_vnni": AutoQuantizationConfig.avx512_vnni,
+        "avx512": AutoQuantizationConfig.avx512,
+        "avx2": AutoQuantizationConfig.avx2,
+        "arm64": AutoQuantizationConfig.arm64
+    }[profile]
+    return make_config(is_static=is_static, per_channel=True, operators_to_quantize=operators)
+
+
+def annotate_shapes(model_path, annotated_path):
+    """Save a copy of the graph with inferred tensor types for the quantizer to read.
+
+    Plain ONNX shape inference cannot see past fused contrib ops such as
+    Attention; ORT's symbolic inference can. The source model is left as is.
+    """
+    import onnx
+    from onnxruntime.tools.symbolic_shape_infer import SymbolicShapeInference
+
+    model = onnx.load(model_path)
+    onnx.save(SymbolicShapeInference.infer_shapes(model, auto_merge=True), annotated_path)
+    return annotated_path
+
+
+def quantize_model(output_dir, source_path, profile="avx512_vnni"):
+    """Apply INT8 dynamic quantization and save it as model_quantized.onnx."""
+    from optimum.onnxruntime import ORTQuantizer
+
+    # Optimum names the output after its source, so name the annotated copy
+    # after the target and add no suffix
+    quantized_path = output_dir / "model_quantized.onnx"
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        annotate_shapes(source_path, Path(tmp_dir) / quantized_path.name)
+        quantizer = ORTQuantizer.from_pretrained(tmp_dir, file_name=quantized_path.name)
+        quantizer.quantize(save_dir=output_dir, file_suffix=None,
+                           quantization_config=quantization_config(profile, False))
+    return quantized_path
+
+
+def make_calibration_reader(tokenizer, sentences, input_names, max_len, batch_size=8):
+    """Build a CalibrationDataReader over pre-tokenized batches of sentences."""
+    import numpy as np
+    from onnxruntime.quantization import CalibrationDataReader
+
+    batches = []
+    for i in range(0, len(sentences), batch_size):
+        encoded = tokenizer(sentences[i:i + batch_size], padding="max_length", truncation=True,
+                            max_length=max_len, return_tensors="np")
+        batches.append({name: encoded[name].astype(np.int64) for name in input_names})
+
+    class CalibReader(CalibrationDataReader):
+        def __init__(self):
+            self._batches = iter(batches)
+
+        def get_next(self):
+            return next(self._batches, None)
+
+    return CalibReader()
+
+
+def quantize_model_static(output_dir, source_path, tokenizer, sentences, max_len,
+                          profile="avx512_vnni"):
+    """Apply INT8 static quantization (weights and activations) and save it as model_quantized.onnx."""
+    import onnx
+    from onnxruntime.quantization import quantize_static
+
+    qconfig = quantization_config(profile, True)
+    input_names = [inp.name for inp in onnx.load(source_path, load_external_data=False).graph.input]
+
+    quantized_path = output_dir / "model_quantized.onnx"
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        quantize_static(
+            annotate_shapes(source_path, Path(tmp_dir) / source_path.name),
+            quantized_path,
+            make_calibration_reader(tokenizer, sentences, input_names, max_len),
+            quant_format=qconfig.format,
+            op_types_to_quantize=qconfig.operators_to_quantize,
+            per_channel=qconfig.per_channel,
+            reduce_range=qconfig.reduce_range,
+            activation_type=qconfig.activations_dtype,
+            weight_type=qconfig.weights_dtype,
+            extra_options={
+                "ActivationSymmetric": qconfig.activations_symmetric,
+                "WeightSymmetric": qconfig.weights_symmetric
+            }
+        )
+    return quantized_path
+
+
+def load_calibration_sentences(calibration_file):
+    """Read one calibration sentence per non-empty line."""
+    with Path(calibration_file).open(encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def file_sha256(model_path):
+    """SHA-256 of an ONNX model together with its external-data sidecar."""
+    digest = hashlib.sha256()
+    for path in (model_path, sidecar_path(model_path)):
+        try:
+            with path.open("rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+        except FileNotFoundError:
+            continue
+    return digest.hexdigest()
+
+
+def resolve_revision(model_name):
+    """Commit hash of the model's current HuggingFace revision, or None if offline."""
+    try:
+        from huggingface_hub import model_info
+        return model_info(model_name).sha
+    except Exception:
+        return None
+
+
+def cached_revision(model_name):
+    """Commit hash of the locally cached model config, or None for local paths."""
+    try:
+        from transformers import AutoConfig
+        return getattr(AutoConfig.from_pretrained(model_name), "_commit_hash", None)
+    except Exception:
+        return None
+
+
+def load_current_manifest(output_dir, revision, options):
+    """Return the export manifest if output_dir already holds this exact export."""
+    try:
+        with (output_dir / "export_manifest.json").open() as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if manifest.get("options") != options:
+        return None
+    # Offline runs cannot see the upstream revision; trust the recorded one
+    if revision and manifest.get("hf_revision") != revision:
+        return None
+
+    model_path = output_dir / "model.onnx"
+    if not model_path.exists() or file_sha256(model_path) != manifest.get("sha256"):
+        return None
+    if not all((output_dir / f).exists() for f in manifest.get("files", {}).values()):
+        return None
+    return manifest
+
+
+def write_manifest(output_dir, revision, options, files):
+    """Record what was exported so unchanged re-runs can be skipped."""
+    import optimum.version
+
+    manifest = {
+        "hf_revision": revision,
+        "sha256": file_sha256(output_dir / "model.onnx"),
+        "optimum_version": optimum.version.__version__,
+        "options": options,
+        "files": files
+    }
+    with (output_dir / "export_manifest.json").open("w") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def variant_name(role, quant_profile):
+    """Key of a model variant in veccy_model.json, e.g. int8_vnni for AVX512-VNNI INT8."""
+    if role == "quantized":
+        return "int8_vnni" if quant_profile == "avx512_vnni" else f"int8_{quant_profile}"
+    return {"model": "fp32", "static": "fp32_static", "fp16": "fp16_cuda"}[role]
+
+
+def write_model_descriptor(output_dir, model_key, info, paths, quant_profile, opset):
+    """Write veccy_model.json, everything Veccy's Java loader needs in one file.
+
+    The top-level keys are an ONNXEmbeddingProcessor config for the default
+    variant (INT8 if quantized); `variants` lists every emitted model so the
+    loader can pick another one for the host it runs on. Like the manifest,
+    file paths are relative to the export directory so it can be moved.
+    """
+    model_path = paths.get("quantized", paths["model"])
+    descriptor = {
+        "model_path": model_path.name,
+        "tokenizer_path": "tokenizer.json",
+        "dimensions": info["dims"],
+        "max_length": info["max_len"],
+        "pooling": info["pooling"],
+        "normalize": info["normalize"],
+        "onnx_opset": opset,
+        "quantized": "quantized" in paths,
+        "vnni": "quantized" in paths and quant_profile == "avx512_vnni",
+        "intra_op_num_threads": default_intra_op_threads(),
+        "inter_op_num_threads": 1,
+        "graph_optimization_level": "ALL",
+        "arena_extend_strategy": "kSameAsRequested",
+        "use_io_binding": True,
+        "source_model": {"key": model_key, **info},
+        "variants": {
+            variant_name(role, quant_profile): {
+                "path": path.name,
+                "sha256": file_sha256(path),
+                "size_bytes": model_size(path)
+            }
+            for role, path in paths.items()
+        }
+    }
+
+    descriptor_path = output_dir / "veccy_model.json"
+    with descriptor_path.open("w") as f:
+        json.dump(descriptor, f, indent=2)
+    return descriptor_path
+
+
+def run_export(model_name, output_dir, quantize, quant_profile, fixed_batch, fixed_len, fp16,
+               max_len=128, calibration_file=DEFAULT_CALIBRATION_FILE, opset=DEFAULT_OPSET,
+               trt_engine=False):
+    """Download, convert and post-process a model; return the model paths by role."""
+    from optimum.exporters.onnx import main_export
+    from optimum.onnxruntime import ORTModelForFeatureExtraction
+    from transformers import AutoTokenizer
+
+    # Create output directory
+    output_dir.mkdir(parents=True, exist_ok=True)
+    print("\n[1/5] Created output directory")
+
+    # Export model to ONNX, fetching the tokenizer from the Hub in parallel;
+    # both calls release the GIL while downloading
+    print("[2/5] Downloading and exporting model to ONNX...")
+    print("      (This may take a few minutes on first run)")
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        tokenizer_future = executor.submit(AutoTokenizer.from_pretrained, model_name, use_fast=True)
+
+        # Pin the opset and, if requested, trace with the target shapes so
+        # shape-dependent ops are specialized
+        shape_kwargs = {}
+        if fixed_batch:
+            shape_kwargs["batch_size"] = fixed_batch
+        if fixed_len:
+            shape_kwargs["sequence_length"] = fixed_len
+        main_export(
+            model_name_or_path=model_name,
+            output=output_dir,
+            task="feature-extraction",
+            # Plain transformers export (last_hidden_state, token_type_ids),
+            # whether or not sentence-transformers is installed
+            library_name="transformers",
+            opset=opset,
+            **shape_kwargs
+        )
+        model = ORTModelForFeatureExtraction.from_pretrained(output_dir)
+
+        print("      ✓ Model exported successfully")
+
+        # Load and save tokenizer
+        print("[3/5] Loading tokenizer...")
+        tokenizer = tokenizer_future.result()
+
+    if not tokenizer.is_fast:
+        raise ValueError(f"{model_name} has no fast tokenizer")
+
+    print("      ✓ Tokenizer loaded")
+
+    # Save everything
+    print("[4/5] Saving to disk...")
+    tokenizer.save_pretrained(output_dir)  # main_export already wrote the model
+    # Single-file merged vocab so the Java tokenizer needs no vocab.txt/merges.txt
+    tokenizer.backend_tokenizer.save(str(output_dir / "tokenizer.json"))
+
+    print("      ✓ Files saved")
+
+    # Bake EmbedLayerNorm/Attention/SkipLayerNorm fusions into the graph
+    print("[5/5] Optimizing ONNX graph...")
+    if not prepass_model(output_dir / "model.onnx"):
+        print("      ℹ onnxoptimizer not installed, skipping pre-pass (pip install onnxoptimizer)")
+    model_path = optimize_model(model, output_dir)
+    if model_path:
+        print("      ✓ Optimized graph saved")
+    else:
+        model_path = output_dir / "model.onnx"
+
+    static_path = None
+    if fixed_batch or fixed_len:
+        print("[*]   Pinning input shapes...")
+        static_path = make_static_model(
+            output_dir / "model.onnx",
+            output_dir,
+            batch_size=fixed_batch,
+            sequence_length=fixed_len
+        )
+        print("      ✓ Static model saved")
+
+    quantized_path = None
+    if quantize == "dynamic":
+        print(f"[*]   Quantizing model (INT8 dynamic, {quant_profile})...")
+        quantized_path = quantize_model(output_dir, model_path, quant_profile)
+        print("      ✓ Quantized model saved")
+    elif quantize == "static":
+        sentences = load_calibration_sentences(calibration_file)
+        print(f"[*]   Quantizing model (INT8 static, {quant_profile}, {len(sentences)} calibration sentences)...")
+        quantized_path = quantize_model_static(output_dir, model_path, tokenizer, sentences,
+                                               max_len, quant_profile)
+        print("      ✓ Quantized model saved")
+
+    fp16_path = None
+    if fp16:
+        print("[*]   Converting weights to FP16...")
+        fp16_path = convert_to_fp16(model_path, output_dir)
+        print("      ✓ FP16 model saved")
+
+    # Serialize weights of every emitted graph to sidecar files
+    print("[*]   Moving weights to external data files...")
+    onnx_files = [output_dir / "model.onnx", model_path,
+                  static_path, quantized_path, fp16_path]
+    for path in dict.fromkeys(p for p in onnx_files if p):
+        externalize_weights(path)
+    print("      ✓ Weights saved alongside each .onnx file")
+
+    # TensorRT runs the raw graph; ORT's fused contrib ops have no TRT kernels
+    if trt_engine:
+        print("[*]   Building TensorRT engine (this can take several minutes)...")
+        if build_trt_engine(output_dir / "model.onnx", output_dir, max_len, fixed_batch, fixed_len):
+            print("      ✓ Engine cached in trt_cache/")
+        else:
+            print("      ℹ TensorRT not available (or no engine was built), skipping engine build")
+
+    paths = {"model": model_path, "quantized": quantized_path, "static": static_path, "fp16": fp16_path}
+    return {role: path for role, path in paths.items() if path}
+
+
+def find_exported_files(output_dir):
+    """Map variant roles to model files in an export directory."""
+    manifest_path = output_dir / "export_manifest.json"
+    if manifest_path.exists():
+        with manifest_path.open() as f:
+            files = json.load(f)["files"]
+    else:
+        main_file = "model_optimized.onnx"
+        if not (output_dir / main_file).exists():
+            main_file = "model.onnx"
+        files = {"model": main_file, "quantized": "model_quantized.onnx",
+                 "static": "model_static.onnx", "fp16": "model_fp16.onnx"}
+
+    paths = {role: output_dir / f for role, f in files.items()}
+    return {role: path for role, path in paths.items() if path.exists()}
+
+
+def verify_export(info, output_dir, paths):
+    """Verify every model variant in an export directory."""
+    from transformers import AutoTokenizer
+
+    print("\n" + "-"*80)
+    print("Verifying exported model...")
+    model_path = paths["model"]
+    tokenizer = AutoTokenizer.from_pretrained(output_dir, use_fast=True)
+    results = [verify_onnx_model(model_path, info['dims'], info['max_len'], tokenizer=tokenizer)]
+    if "quantized" in paths:
+        print("\n  Quantized model:")
+        results.append(verify_onnx_model(paths["quantized"], info['dims'], info['max_len'], quantized=True))
+    if "static" in paths:
+        print("\n  Static model:")
+        results.append(verify_onnx_model(paths["static"], info['dims'], info['max_len'], static=True))
+    if "fp16" in paths:
+        print("\n  FP16 model:")
+        results.append(verify_onnx_model(paths["fp16"], info['dims'], info['max_len'],
+                                         fp16=True, baseline_path=model_path))
+    return all(results)
+
+
+def verify_model(model_key, output_base_dir="./models"):
+    """Verify a previously exported model without re-exporting it."""
+    if model_key not in MODELS:
+        print(f"\n✗ Error: Unknown model '{model_key}'")
+        print("\nUse the list command to see all models with descriptions")
+        return False
+
+    output_dir = Path(output_base_dir) / f"{model_key}-onnx"
+    paths = find_exported_files(output_dir)
+    if "model" not in paths:
+        print(f"\n✗ Error: No exported model found in {output_dir}")
+        return False
+
+    success = verify_export(MODELS[model_key], output_dir, paths)
+    print("\n" + "="*80)
+    print("✓ Verification passed" if success else "✗ Verification failed")
+    print("="*80 + "\n")
+    return success
+
+
+def export_model(model_key, output_base_dir="./models", verify=True,
+                 quantize="none", quant_profile="auto",
+                 fixed_batch=None, fixed_seq=False, fp16=False, force=False,
+                 calibration_file=DEFAULT_CALIBRATION_FILE, opset=DEFAULT_OPSET,
+                 trt_engine=False):
     """Export a Sentence Transformers model to ONNX."""
 
     if model_key not in MODELS:
         print(f"\n✗ Error: Unknown model '{model_key}'")
         print(f"\nAvailable models: {', '.join(MODELS.keys())}")
-        print("\nUse --list to see all models with descriptions")
+        print("\nUse the list command to see all models with descriptions")
         return False
 
     info = MODELS[model_key]
     model_name = info["name"]
-    output_dir = os.path.join(output_base_dir, f"{model_key}-onnx")
+    output_dir = Path(output_base_dir) / f"{model_key}-onnx"
 
     print("\n" + "="*80)
     print("Exporting Sentence Transformers Model to ONNX")
@@ -200,64 +1013,106 @@ def export_model(model_key, output_base_dir="./models", verify=True):
     print(f"Dimensions:      {info['dims']}")
     print(f"Max Length:      {info['max_len']}")
     print(f"Parameters:      {info['params']}")
+    print(f"ONNX Opset:      {opset}")
+    if quantize != "none":
+        if quant_profile == "auto":
+            quant_profile = detect_quant_profile()
+            print(f"Quantization:    INT8 {quantize} ({quant_profile}, detected)")
+        else:
+            print(f"Quantization:    INT8 {quantize} ({quant_profile})")
+    if quantize == "static":
+        print(f"Calibration:     {calibration_file}")
+    fixed_len = info['max_len'] if fixed_seq else None
+    if fixed_batch or fixed_len:
+        print(f"Static Shapes:   batch={fixed_batch or 'dynamic'}, sequence={fixed_len or 'dynamic'}")
+    if fp16:
+        print("FP16 Variant:    yes")
+    if trt_engine:
+        print("TensorRT Engine: yes")
     print("\n" + "-"*80)
 
     try:
-        # Create output directory
-        os.makedirs(output_dir, exist_ok=True)
-        print("\n[1/4] Created output directory")
+        options = {
+            "quantize": quantize,
+            "quant_profile": quant_profile if quantize != "none" else None,
+            "fixed_batch": fixed_batch,
+            "fixed_seq": fixed_len,
+            "fp16": fp16,
+            "opset": opset,
+            "trt_engine": trt_engine
+        }
+        if quantize == "static":
+            options["calibration_sha256"] = hashlib.sha256(Path(calibration_file).read_bytes()).hexdigest()
+        revision = resolve_revision(model_name)
+        manifest = None if force else load_current_manifest(output_dir, revision, options)
 
-        # Export model to ONNX
-        print("[2/4] Downloading and exporting model to ONNX...")
-        print("      (This may take a few minutes on first run)")
-
-        model = ORTModelForFeatureExtraction.from_pretrained(
-            model_name,
-            export=True
-        )
+        if manifest:
+            print("\n✓ Existing export is up to date, skipping (use --force to re-export)")
+            paths = {role: output_dir / f for role, f in manifest["files"].items()}
+        else:
+            paths = run_export(model_name, output_dir, quantize, quant_profile,
+                               fixed_batch, fixed_len, fp16, info['max_len'],
+                               calibration_file, opset, trt_engine)
+            # Offline, fall back to the revision the export was made from
+            revision = revision or cached_revision(model_name)
+            write_manifest(output_dir, revision, options,
+                           {role: path.name for role, path in paths.items()})
 
-        print("      ✓ Model exported successfully")
-
-        # Load and save tokenizer
-        print("[3/4] Loading tokenizer...")
-        tokenizer = AutoTokenizer.from_pretrained(model_name)
-
-        print("      ✓ Tokenizer loaded")
-
-        # Save everything
-        print("[4/4] Saving to disk...")
-        model.save_pretrained(output_dir)
-        tokenizer.save_pretrained(output_dir)
-
-        print("      ✓ Files saved")
+        model_path = paths["model"]
+        quantized_path = paths.get("quantized")
+        static_path = paths.get("static")
+        fp16_path = paths.get("fp16")
 
         # Verify the model
-        if verify:
-            print("\n" + "-"*80)
-            print("Verifying exported model...")
-            model_path = os.path.join(output_dir, "model.onnx")
-            verify_onnx_model(model_path, info['dims'])
+        if verify and not verify_export(info, output_dir, paths):
+            print("\n" + "="*80)
+            print("✗ Export failed verification")
+            print("="*80 + "\n")
+            return False
+
+        # Model config and variant list for Veccy's Java loader; hashing every
+        # variant is slow, so an up-to-date export keeps its existing file
+        java_model_file = (quantized_path or model_path).name
+        descriptor_path = output_dir / "veccy_model.json"
+        if not (manifest and descriptor_path.exists()):
+            write_model_descriptor(output_dir, model_key, info, paths, quant_profile, opset)
 
         # Print success message and usage instructions
         print("\n" + "="*80)
         print("✓ Export Successful!")
         print("="*80)
 
-        print(f"\nModel files saved to: {os.path.abspath(output_dir)}")
+        print(f"\nModel files saved to: {output_dir.resolve()}")
         print(f"\nFiles:")
-        for file in os.listdir(output_dir):
-            file_path = os.path.join(output_dir, file)
-            size = os.path.getsize(file_path) / (1024*1024)  # MB
-            print(f"  - {file:30s} ({size:6.2f} MB)")
+        with os.scandir(output_dir) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for entry in entries:
+            size = entry.stat().st_size / (1024*1024)  # MB, stat cached by scandir
+            print(f"  - {entry.name:30s} ({size:6.2f} MB)")
 
         print("\n" + "-"*80)
         print("Java Configuration for Veccy:")
         print("-"*80)
+        extra_lines = ""
+        if static_path:
+            extra_lines += (f'\n// Fixed-shape variant (batch={fixed_batch or "dynamic"}, '
+                            f'sequence={fixed_len or "dynamic"}): {static_path.as_posix()}')
+        if fp16_path:
+            extra_lines += f'\n// FP16 variant for CUDA/DirectML: {fp16_path.as_posix()}'
+        trt_cache = output_dir / "trt_cache"
+        if any(trt_cache.glob("*.engine")):
+            extra_lines += (f'\n// TensorRT engine cache for model.onnx: {trt_cache.as_posix()}'
+                            f'\n// (trt_engine_cache_path; only valid on the same GPU architecture and TensorRT version)')
         print(f"""
+// {java_model_file}_data holds the weights and must ship alongside {java_model_file}
+// All variants (with SHA-256 and size) are listed under "variants"
+// File paths in veccy_model.json are relative to the export directory
+Path modelDir = Path.of("{output_dir.as_posix()}");
 Map<String, Object> config = new HashMap<>();
-config.put("model_path", "{output_dir}/model.onnx");
-config.put("dimensions", {info['dims']});
-config.put("max_length", {info['max_len']});
+config.putAll(new ObjectMapper().readValue(
+        modelDir.resolve("veccy_model.json").toFile(),
+        new TypeReference<Map<String, Object>>() {{}}));
+config.put("model_path", modelDir.resolve((String) config.get("model_path")).toString());{extra_lines}
 
 ONNXEmbeddingProcessor embedder = new ONNXEmbeddingProcessor();
 embedder.initialize(config);
@@ -285,64 +1140,206 @@ print(f"First 5 values: {{embedding[:5]}}")
         return False
 
 
-def main():
+def export_models(model_keys, **export_kwargs):
+    """Export several models concurrently, one worker process per model."""
+    workers = min(len(model_keys), max(1, (os.cpu_count() or 2) // 2))
+    print(f"\nExporting {len(model_keys)} models with {workers} worker(s): {', '.join(model_keys)}")
+
+    failed = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(export_model, key, **export_kwargs): key for key in model_keys}
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                success = future.result()
+            except Exception as e:
+                print(f"\n✗ Worker for '{key}' crashed: {e}")
+                success = False
+            if not success:
+                failed.append(key)
+
+    print("\n" + "="*80)
+    for key in model_keys:
+        print(f"  {'✗' if key in failed else '✓'} {key}")
+    print("="*80 + "\n")
+    return not failed
+
+
+COMMANDS = ('list', 'export', 'verify')
+
+
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Export Sentence Transformers models to ONNX for Veccy",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
-  python export_sentence_transformer.py all-MiniLM-L6-v2
-  python export_sentence_transformer.py --list
-  python export_sentence_transformer.py all-mpnet-base-v2 --output ./my_models
-  python export_sentence_transformer.py paraphrase-MiniLM-L3-v2 --no-verify
+  python export_sentence_transformer.py list
+  python export_sentence_transformer.py export all-MiniLM-L6-v2
+  python export_sentence_transformer.py export all-mpnet-base-v2 --output ./my_models
+  python export_sentence_transformer.py export paraphrase-MiniLM-L3-v2 --no-verify
+  python export_sentence_transformer.py export all-MiniLM-L6-v2 --opset 18
+  python export_sentence_transformer.py export all-MiniLM-L6-v2 --quantize dynamic
+  python export_sentence_transformer.py export all-MiniLM-L6-v2 --quantize static --calibration-file my_corpus.txt
+  python export_sentence_transformer.py export all-MiniLM-L6-v2 --fixed-batch 8 --fixed-seq
+  python export_sentence_transformer.py export all-mpnet-base-v2 --fp16
+  python export_sentence_transformer.py export all-mpnet-base-v2 --build-trt-engine
+  python export_sentence_transformer.py export --models all-MiniLM-L6-v2,all-mpnet-base-v2
+  python export_sentence_transformer.py export all-MiniLM-L6-v2 --force
+  python export_sentence_transformer.py verify all-MiniLM-L6-v2
 
 For more information: https://github.com/skanga/veccy
         """
     )
+    sub = parser.add_subparsers(dest='cmd', metavar='{list,export,verify}')
+
+    sub.add_parser('list', help='List all available models')
 
-    parser.add_argument(
+    export = sub.add_parser('export', help='Export a model to ONNX')
+    export.add_argument(
         'model',
         nargs='?',
-        help='Model key to export (use --list to see available models)'
+        help='Model key to export (use the list command to see available models)'
     )
-    parser.add_argument(
-        '--list',
-        action='store_true',
-        help='List all available models'
+    export.add_argument(
+        '--models',
+        metavar='A,B,C',
+        help='Comma-separated model keys to export in parallel worker processes'
     )
-    parser.add_argument(
+    export.add_argument(
         '--output',
         default='./models',
         help='Output directory for exported models (default: ./models)'
     )
-    parser.add_argument(
+    export.add_argument(
         '--no-verify',
         action='store_true',
         help='Skip model verification after export'
     )
+    export.add_argument(
+        '--force',
+        action='store_true',
+        help='Re-export even if the output directory already holds an up-to-date export'
+    )
+    export.add_argument(
+        '--quantize',
+        choices=['none', 'dynamic', 'static'],
+        default='none',
+        help='Also emit an INT8 model_quantized.onnx; static also quantizes activations '
+             'using a calibration set (default: none)'
+    )
+    export.add_argument(
+        '--calibration-file',
+        default=str(DEFAULT_CALIBRATION_FILE),
+        metavar='PATH',
+        help='Text file with one representative sentence per line for --quantize static '
+             '(default: calibration.txt next to this script)'
+    )
+    export.add_argument(
+        '--quant-profile',
+        choices=('auto',) + QUANT_PROFILES,
+        default='auto',
+        help='Target CPU for quantization (default: auto, detected from the host CPU)'
+    )
+    export.add_argument(
+        '--opset',
+        type=int,
+        default=DEFAULT_OPSET,
+        help=f'ONNX opset to export with (default: {DEFAULT_OPSET}, adds native LayerNormalization)'
+    )
+    export.add_argument(
+        '--fixed-batch',
+        type=int,
+        metavar='B',
+        help='Also emit model_static.onnx with the batch dimension pinned to B'
+    )
+    export.add_argument(
+        '--fixed-seq',
+        action='store_true',
+        help="Also emit model_static.onnx with the sequence length pinned to the model's max length"
+    )
+    export.add_argument(
+        '--fp16',
+        action='store_true',
+        help='Also emit model_fp16.onnx for GPU/DirectML'
+    )
+    export.add_argument(
+        '--build-trt-engine',
+        action='store_true',
+        help='Prebuild a TensorRT FP16 engine cache in trt_cache/ (requires the TensorRT execution provider)'
+    )
 
-    args = parser.parse_args()
+    verify = sub.add_parser('verify', help='Verify a previously exported model')
+    verify.add_argument(
+        'model',
+        help='Model key to verify'
+    )
+    verify.add_argument(
+        '--output',
+        default='./models',
+        help='Directory the model was exported to (default: ./models)'
+    )
+
+    # Backward compatibility: `--list` and a bare model key predate subcommands
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if '--list' in argv:
+        argv = ['list']
+    elif argv and argv[0] not in COMMANDS and argv[0] not in ('-h', '--help'):
+        argv = ['export'] + argv
+
+    args = parser.parse_args(argv)
 
     # Show list if requested
-    if args.list:
+    if args.cmd == 'list':
         list_models()
         return 0
 
-    # Require model argument if not listing
-    if not args.model:
+    if args.cmd is None:
         parser.print_help()
         print("\n" + "="*80)
-        print("Error: Please specify a model to export or use --list to see available models")
+        print("Error: Please specify a command, e.g. 'export <model-key>' or 'list'")
+        print("="*80 + "\n")
+        return 1
+
+    if not require_dependencies():
+        return 1
+
+    if args.cmd == 'verify':
+        return 0 if verify_model(args.model, output_base_dir=args.output) else 1
+
+    model_keys = [args.model] if args.model else []
+    if args.models:
+        model_keys += [key.strip() for key in args.models.split(',') if key.strip()]
+    model_keys = list(dict.fromkeys(model_keys))
+
+    # Require model argument when exporting
+    if not model_keys:
+        export.print_help()
+        print("\n" + "="*80)
+        print("Error: Please specify a model to export or use the list command to see available models")
         print("="*80 + "\n")
         return 1
 
-    # Export the model
-    success = export_model(
-        args.model,
+    export_kwargs = dict(
         output_base_dir=args.output,
-        verify=not args.no_verify
+        verify=not args.no_verify,
+        quantize=args.quantize,
+        quant_profile=args.quant_profile,
+        fixed_batch=args.fixed_batch,
+        fixed_seq=args.fixed_seq,
+        fp16=args.fp16,
+        force=args.force,
+        calibration_file=args.calibration_file,
+        opset=args.opset,
+        trt_engine=args.build_trt_engine
     )
 
+    # Export the model(s)
+    if len(model_keys) > 1:
+        success = export_models(model_keys, **export_kwargs)
+    else:
+        success = export_model(model_keys[0], **export_kwargs)
+
     return 0 if success else 1
 
 